@@ -2,207 +2,234 @@
 """
 Add sample data for testing the component generation system
 """
-import os
-import json
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BACKEND_URL = "http://localhost:8000"
+ERROR_PREVIEW_BYTES = 512
 
-def add_sample_entities():
-    """Add sample financial entities"""
-    entities = [
+# Sample payloads, built once at import
+SAMPLE_ENTITIES = (
+    {
+        "name": "Revenue Account",
+        "properties": {
+            "account_type": "revenue",
+            "currency": "USD",
+            "description": "Primary revenue tracking account"
+        }
+    },
+    {
+        "name": "Expense Account", 
+        "properties": {
+            "account_type": "expense",
+            "currency": "USD",
+            "description": "Operating expenses account"
+        }
+    },
+    {
+        "name": "Financial Period",
+        "properties": {
+            "period_type": "monthly",
+            "description": "Monthly reporting period"
+        }
+    }
+)
+
+SAMPLE_FINANCIAL_DATA = {
+    "company": "Sample Corp",
+    "report_type": "monthly_financials",
+    "periods": [
         {
-            "name": "Revenue Account",
-            "properties": {
-                "account_type": "revenue",
-                "currency": "USD",
-                "description": "Primary revenue tracking account"
-            }
+            "period": "2024-01",
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "accounts": [
+                {
+                    "account_id": "REV001",
+                    "account_name": "Sales Revenue",
+                    "account_type": "revenue",
+                    "amount": 25000.00,
+                    "currency": "USD"
+                },
+                {
+                    "account_id": "REV002", 
+                    "account_name": "Service Revenue",
+                    "account_type": "revenue",
+                    "amount": 15000.00,
+                    "currency": "USD"
+                },
+                {
+                    "account_id": "EXP001",
+                    "account_name": "Office Expenses",
+                    "account_type": "expense", 
+                    "amount": -5000.00,
+                    "currency": "USD"
+                }
+            ]
         },
         {
-            "name": "Expense Account", 
-            "properties": {
-                "account_type": "expense",
-                "currency": "USD",
-                "description": "Operating expenses account"
-            }
+            "period": "2024-02",
+            "start_date": "2024-02-01", 
+            "end_date": "2024-02-29",
+            "accounts": [
+                {
+                    "account_id": "REV001",
+                    "account_name": "Sales Revenue",
+                    "account_type": "revenue",
+                    "amount": 28000.00,
+                    "currency": "USD"
+                },
+                {
+                    "account_id": "REV002",
+                    "account_name": "Service Revenue", 
+                    "account_type": "revenue",
+                    "amount": 18000.00,
+                    "currency": "USD"
+                },
+                {
+                    "account_id": "EXP001",
+                    "account_name": "Office Expenses",
+                    "account_type": "expense",
+                    "amount": -5500.00,
+                    "currency": "USD"
+                }
+            ]
         },
         {
-            "name": "Financial Period",
-            "properties": {
-                "period_type": "monthly",
-                "description": "Monthly reporting period"
-            }
+            "period": "2024-03",
+            "start_date": "2024-03-01",
+            "end_date": "2024-03-31", 
+            "accounts": [
+                {
+                    "account_id": "REV001",
+                    "account_name": "Sales Revenue",
+                    "account_type": "revenue",
+                    "amount": 32000.00,
+                    "currency": "USD"
+                },
+                {
+                    "account_id": "REV002",
+                    "account_name": "Service Revenue",
+                    "account_type": "revenue", 
+                    "amount": 22000.00,
+                    "currency": "USD"
+                },
+                {
+                    "account_id": "EXP001",
+                    "account_name": "Office Expenses",
+                    "account_type": "expense",
+                    "amount": -6000.00,
+                    "currency": "USD"
+                }
+            ]
         }
     ]
-    
+}
+
+TEST_PROMPTS = (
+    "Show me a bar chart of total revenue by month",
+    "Create a metric card showing total revenue",
+    "Display a table of all financial accounts",
+    "Show me a KPI dashboard with key financial metrics"
+)
+
+# One keep-alive session for every request the script makes, pooled wide
+# enough for the concurrent prompts; failed connections are retried briefly
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=len(TEST_PROMPTS),
+    pool_maxsize=len(TEST_PROMPTS),
+    max_retries=Retry(total=2, backoff_factor=0.1)
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+def error_preview(response):
+    """Start of a failed (streamed) response's body, without downloading the rest"""
+    chunk = next(response.iter_content(chunk_size=ERROR_PREVIEW_BYTES), b"")
+    return chunk.decode("utf-8", errors="replace")
+
+def add_sample_entities():
+    """Add sample financial entities"""
     print("Adding sample entities...")
-    for entity in entities:
+    for entity in SAMPLE_ENTITIES:
         # We'll add these through the upload system to trigger proper ontology extraction
         pass
 
 def add_sample_data_via_upload():
     """Add sample data by uploading a JSON file"""
     
-    sample_financial_data = {
-        "company": "Sample Corp",
-        "report_type": "monthly_financials",
-        "periods": [
-            {
-                "period": "2024-01",
-                "start_date": "2024-01-01",
-                "end_date": "2024-01-31",
-                "accounts": [
-                    {
-                        "account_id": "REV001",
-                        "account_name": "Sales Revenue",
-                        "account_type": "revenue",
-                        "amount": 25000.00,
-                        "currency": "USD"
-                    },
-                    {
-                        "account_id": "REV002", 
-                        "account_name": "Service Revenue",
-                        "account_type": "revenue",
-                        "amount": 15000.00,
-                        "currency": "USD"
-                    },
-                    {
-                        "account_id": "EXP001",
-                        "account_name": "Office Expenses",
-                        "account_type": "expense", 
-                        "amount": -5000.00,
-                        "currency": "USD"
-                    }
-                ]
-            },
-            {
-                "period": "2024-02",
-                "start_date": "2024-02-01", 
-                "end_date": "2024-02-29",
-                "accounts": [
-                    {
-                        "account_id": "REV001",
-                        "account_name": "Sales Revenue",
-                        "account_type": "revenue",
-                        "amount": 28000.00,
-                        "currency": "USD"
-                    },
-                    {
-                        "account_id": "REV002",
-                        "account_name": "Service Revenue", 
-                        "account_type": "revenue",
-                        "amount": 18000.00,
-                        "currency": "USD"
-                    },
-                    {
-                        "account_id": "EXP001",
-                        "account_name": "Office Expenses",
-                        "account_type": "expense",
-                        "amount": -5500.00,
-                        "currency": "USD"
-                    }
-                ]
-            },
-            {
-                "period": "2024-03",
-                "start_date": "2024-03-01",
-                "end_date": "2024-03-31", 
-                "accounts": [
-                    {
-                        "account_id": "REV001",
-                        "account_name": "Sales Revenue",
-                        "account_type": "revenue",
-                        "amount": 32000.00,
-                        "currency": "USD"
-                    },
-                    {
-                        "account_id": "REV002",
-                        "account_name": "Service Revenue",
-                        "account_type": "revenue", 
-                        "amount": 22000.00,
-                        "currency": "USD"
-                    },
-                    {
-                        "account_id": "EXP001",
-                        "account_name": "Office Expenses",
-                        "account_type": "expense",
-                        "amount": -6000.00,
-                        "currency": "USD"
-                    }
-                ]
-            }
-        ]
-    }
-    
-    # Save to temporary file
-    temp_file = "sample_financial_data.json"
-    with open(temp_file, 'w') as f:
-        json.dump(sample_financial_data, f, indent=2)
+    # Serialize once and upload the bytes directly; no temporary file to
+    # write, re-read and clean up
+    upload_name = "sample_financial_data.json"
+    content = orjson.dumps(SAMPLE_FINANCIAL_DATA, option=orjson.OPT_INDENT_2)
     
-    print(f"Uploading sample data from {temp_file}...")
+    print(f"Uploading sample data as {upload_name}...")
     
     try:
-        with open(temp_file, 'rb') as f:
-            files = {'file': (temp_file, f, 'application/json')}
-            data = {
-                'extract_ontology': True,
-                'auto_approve': True
-            }
-            
-            response = requests.post(
-                f"{BACKEND_URL}/api/upload-json",
-                files=files,
-                data=data,
-                timeout=60
-            )
-            
+        files = {'file': (upload_name, content, 'application/json')}
+        data = {
+            'extract_ontology': True,
+            'auto_approve': True
+        }
+        
+        with SESSION.post(
+            f"{BACKEND_URL}/api/upload-json",
+            files=files,
+            data=data,
+            timeout=60,
+            stream=True
+        ) as response:
             if response.ok:
-                result = response.json()
+                result = orjson.loads(response.content)
                 print("✅ Sample data uploaded successfully!")
-                print(f"📊 Result: {json.dumps(result, indent=2)}")
+                print(f"📊 Result: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
             else:
-                print(f"❌ Upload failed: {response.status_code} - {response.text}")
+                print(f"❌ Upload failed: {response.status_code} - {error_preview(response)}")
                 
     except Exception as e:
         print(f"❌ Error uploading data: {e}")
-    finally:
-        # Clean up temp file
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+
+def generate_component(prompt):
+    """Request one component and return the lines to report for it"""
+    lines = [f"\n📝 Testing prompt: '{prompt}'"]
+    
+    try:
+        with SESSION.post(
+            f"{BACKEND_URL}/api/generate-component",
+            data=orjson.dumps({"prompt": prompt}),
+            headers={"Content-Type": "application/json"},
+            timeout=30,
+            stream=True
+        ) as response:
+            if response.ok:
+                component = orjson.loads(response.content)
+                lines.append(f"✅ Generated component: {component.get('type')} - {component.get('title')}")
+                lines.append(f"📊 Data preview: {str(component.get('data', {}))[:100]}...")
+            else:
+                lines.append(f"❌ Generation failed: {response.status_code} - {error_preview(response)}")
+            
+    except Exception as e:
+        lines.append(f"❌ Error: {e}")
+    
+    return lines
 
 def test_component_generation():
     """Test the component generation with sample prompts"""
     
-    test_prompts = [
-        "Show me a bar chart of total revenue by month",
-        "Create a metric card showing total revenue",
-        "Display a table of all financial accounts",
-        "Show me a KPI dashboard with key financial metrics"
-    ]
-    
     print("\n🧪 Testing component generation...")
     
-    for prompt in test_prompts:
-        print(f"\n📝 Testing prompt: '{prompt}'")
-        
-        try:
-            response = requests.post(
-                f"{BACKEND_URL}/api/generate-component",
-                json={"prompt": prompt},
-                timeout=30
-            )
-            
-            if response.ok:
-                component = response.json()
-                print(f"✅ Generated component: {component.get('type')} - {component.get('title')}")
-                print(f"📊 Data preview: {str(component.get('data', {}))[:100]}...")
-            else:
-                print(f"❌ Generation failed: {response.status_code} - {response.text}")
-                
-        except Exception as e:
-            print(f"❌ Error: {e}")
+    # The prompts are independent, so send them all at once and report the
+    # results in prompt order
+    with ThreadPoolExecutor(max_workers=len(TEST_PROMPTS)) as executor:
+        results = list(executor.map(generate_component, TEST_PROMPTS))
+    
+    for lines in results:
+        print("\n".join(lines))
 
 if __name__ == "__main__":
     print("🚀 Adding sample data for component testing...")
@@ -217,5 +244,7 @@ if __name__ == "__main__":
     # Test component generation
     test_component_generation()
     
-    print("\n🎉 Sample data setup complete!")
-    print("💡 Now try the Canvas tab in your Streamlit app!")
+    print(
+        "\n🎉 Sample data setup complete!\n"
+        "💡 Now try the Canvas tab in your Streamlit app!"
+    )
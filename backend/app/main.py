@@ -1,5 +1,6 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import os
 import json
@@ -48,8 +49,9 @@ async def upload_json(file: UploadFile = File(...)):
         content_str = content.decode('utf-8')
         json_data = json.loads(content_str)
 
-        # Create file hash for deduplication
-        file_hash = hashlib.md5(content_str.encode()).hexdigest()
+        # Create file hash for deduplication (hash the bytes already read
+        # rather than re-encoding the decoded text into a second copy)
+        file_hash = hashlib.md5(content).hexdigest()
         
         # Store file metadata
         file_id = supabase_service.insert_file(file.filename, file_hash, content_str)
@@ -72,16 +74,8 @@ async def upload_json(file: UploadFile = File(...)):
         # Extract ontology proposals
         proposals = ontology_extractor.extract_ontology_proposals(json_data, file_id)
         
-        # Store proposals in database
-        stored_proposals = []
-        for proposal in proposals:
-            stored_proposal = supabase_service.insert_proposal(
-                proposal_type=proposal["type"],
-                payload=proposal["payload"],
-                created_by="system"
-            )
-            if stored_proposal:
-                stored_proposals.append(stored_proposal)
+        # Store proposals in database with one bulk insert
+        stored_proposals = supabase_service.insert_proposals(proposals, created_by="system")
 
         return {
             "message": f"Successfully processed {file.filename}",
@@ -127,9 +121,7 @@ def approve_proposal(proposal_id: str):
 def get_ontology_structure():
     """Get the current ontology structure counts"""
     try:
-        entities = supabase_service.get_ontology_entities()
-        relations = supabase_service.get_ontology_relations()
-        instances = supabase_service.get_ontology_instances()
+        entities, relations, instances = supabase_service.get_ontology_data()
 
         return {
             "entities": len(entities),
@@ -143,9 +135,7 @@ def get_ontology_structure():
 def get_ontology_graph_data():
     """Get full ontology data for graph visualization"""
     try:
-        entities = supabase_service.get_ontology_entities()
-        relations = supabase_service.get_ontology_relations()
-        instances = supabase_service.get_ontology_instances()
+        entities, relations, instances = supabase_service.get_ontology_data()
 
         return {
             "entities": entities,
@@ -173,9 +163,7 @@ async def chat(inp: ChatInput):
         print(f"\n🔍 STEP 1: Fetching ontology data from Supabase...")
         
         # Get current ontology data for context
-        entities = supabase_service.get_ontology_entities()
-        relations = supabase_service.get_ontology_relations()
-        instances = supabase_service.get_ontology_instances()
+        entities, relations, instances = supabase_service.get_ontology_data()
         
         print(f"✅ Data fetched: {len(entities)} entities, {len(relations)} relations, {len(instances)} instances")
 
@@ -278,13 +266,50 @@ async def chat(inp: ChatInput):
         
         return {"text": f"I encountered an error while processing your question. Please try again or check if your ontology data is properly loaded.", "widgets": []}
 
+@app.post("/api/chat/stream")
+async def chat_stream(inp: ChatInput):
+    """Same as /api/chat, but streams the answer as server-sent events"""
+    
+    def events():
+        print("\n🤖 === STREAMING CHAT REQUEST STARTED ===")
+        print(f"📝 User Message: '{inp.message}'")
+        
+        streamed = False
+        try:
+            entities, relations, instances = supabase_service.get_ontology_data()
+            print(f"✅ Data fetched: {len(entities)} entities, {len(relations)} relations, {len(instances)} instances")
+            
+            for chunk in genai_service.stream_ontology_response(
+                user_message=inp.message,
+                entities=entities,
+                relations=relations,
+                instances=instances
+            ):
+                streamed = True
+                # JSON-encode each chunk so newlines inside it can't end the event early
+                yield f"data: {json.dumps(chunk)}\n\n"
+            
+        except Exception as e:
+            print("\n❌ === STREAMING CHAT REQUEST FAILED ===")
+            print(f"💥 Error: {e}")
+            print(f"🔍 Error type: {type(e).__name__}")
+            import traceback
+            print(f"📍 Traceback: {traceback.format_exc()}")
+            print("❌ === END ERROR LOG ===\n")
+            
+            if streamed:
+                message = "\n\n⚠️ The response was interrupted. Please try again."
+            else:
+                message = "I encountered an error while processing your question. Please try again or check if your ontology data is properly loaded."
+            yield f"data: {json.dumps(message)}\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 @app.get("/api/debug/raw-data")
 async def get_raw_debug_data():
     """Get raw ontology data for debugging - shows exact structure"""
     try:
-        entities = supabase_service.get_ontology_entities()
-        relations = supabase_service.get_ontology_relations()
-        instances = supabase_service.get_ontology_instances()
+        entities, relations, instances = supabase_service.get_ontology_data()
         
         return {
             "entities": {
@@ -327,9 +352,7 @@ async def generate_component(inp: ComponentGenerationInput):
         print(f"\n🔍 STEP 1: Fetching ontology data for component generation...")
 
         # Get current ontology data for context
-        entities = supabase_service.get_ontology_entities()
-        relations = supabase_service.get_ontology_relations()
-        instances = supabase_service.get_ontology_instances()
+        entities, relations, instances = supabase_service.get_ontology_data()
 
         print(f"✅ Data fetched: {len(entities)} entities, {len(relations)} relations, {len(instances)} instances")
 
@@ -364,9 +387,7 @@ async def refresh_component_data(component_spec: dict):
 
     try:
         # Get fresh ontology data
-        entities = supabase_service.get_ontology_entities()
-        relations = supabase_service.get_ontology_relations()
-        instances = supabase_service.get_ontology_instances()
+        entities, relations, instances = supabase_service.get_ontology_data()
 
         print(f"✅ Fresh data fetched: {len(entities)} entities, {len(relations)} relations, {len(instances)} instances")
 
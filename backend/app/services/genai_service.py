@@ -3,7 +3,7 @@ GenAI Service - Real AI/LLM integration for intelligent responses
 """
 import os
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
 from datetime import datetime
 from openai import OpenAI
 from langchain.schema import HumanMessage, SystemMessage
@@ -93,6 +93,47 @@ class GenAIService:
             print(f"❌ GenAI Error: {e}")
             return self._fallback_response(user_message, entities, relations, instances)
 
+    def stream_ontology_response(
+        self,
+        user_message: str,
+        entities: List[Dict],
+        relations: List[Dict],
+        instances: List[Dict]
+    ) -> Iterator[str]:
+        """Stream an AI-powered response about ontology data as text chunks"""
+        
+        if not self.use_openai:
+            yield self._fallback_response(user_message, entities, relations, instances)["text"]
+            return
+        
+        streamed = False
+        try:
+            context = self._build_ai_context(entities, relations, instances)
+            
+            stream = self.client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": self._create_system_prompt()},
+                    {"role": "user", "content": self._create_user_prompt(user_message, context)}
+                ],
+                temperature=0.1,
+                max_tokens=1000,
+                stream=True
+            )
+            
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    streamed = True
+                    yield chunk.choices[0].delta.content
+            
+        except Exception as e:
+            print(f"❌ GenAI Streaming Error: {e}")
+            if streamed:
+                # Part of the answer is already out; don't append a canned reply to it
+                yield "\n\n⚠️ The response was interrupted. Please try again."
+            else:
+                yield self._fallback_response(user_message, entities, relations, instances)["text"]
+
     def generate_component_specification(
         self,
         user_prompt: str,
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from supabase import create_client, Client
 from typing import Optional
 
@@ -59,6 +60,23 @@ class SupabaseService:
         }).execute()
         return result.data[0] if result.data else None
     
+    def insert_proposals(self, proposals: list, created_by: str = "system") -> list:
+        """Insert several proposals for human approval in a single request"""
+        if not proposals:
+            return []
+        
+        proposal_records = []
+        for proposal in proposals:
+            proposal_records.append({
+                "type": proposal["type"],
+                "payload": proposal["payload"],
+                "status": "pending",
+                "created_by": created_by
+            })
+        
+        result = self.client.table("kudwa_proposals").insert(proposal_records).execute()
+        return result.data if result.data else []
+    
     def get_pending_proposals(self) -> list:
         """Get all pending proposals"""
         result = self.client.table("kudwa_proposals").select("*").eq("status", "pending").execute()
@@ -167,6 +185,18 @@ class SupabaseService:
                 "kudwa_conversations"
             ]
 
+            # One TRUNCATE on the server when migrations/002 has been applied,
+            # instead of a row-returning DELETE per table
+            try:
+                self.client.rpc("kudwa_reset_all_data").execute()
+                return {
+                    "message": "Database reset completed",
+                    "results": {table: "truncated" for table in tables_to_clear},
+                    "timestamp": "now()"
+                }
+            except Exception as e:
+                print(f"kudwa_reset_all_data unavailable, deleting per table: {e}")
+
             results = {}
             for table in tables_to_clear:
                 try:
@@ -191,6 +221,14 @@ class SupabaseService:
                 "timestamp": "now()"
             }
 
+    def get_ontology_data(self) -> tuple:
+        """Get entities, relations and instances, fetching the three concurrently"""
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            entities = executor.submit(self.get_ontology_entities)
+            relations = executor.submit(self.get_ontology_relations)
+            instances = executor.submit(self.get_ontology_instances)
+            return entities.result(), relations.result(), instances.result()
+
     def get_ontology_entities(self) -> list:
         """Get all approved entities from the ontology"""
         try:
@@ -0,0 +1,18 @@
+-- Reset every POC table in one statement (used by /api/reset-all-data)
+CREATE OR REPLACE FUNCTION kudwa_reset_all_data()
+RETURNS void
+LANGUAGE sql
+AS $$
+  TRUNCATE TABLE
+    kudwa_vectors,
+    kudwa_chunks,
+    kudwa_instances,
+    kudwa_ontology_relations,
+    kudwa_ontology_entities,
+    kudwa_proposals,
+    kudwa_files,
+    kudwa_widgets,
+    kudwa_messages,
+    kudwa_conversations
+  RESTART IDENTITY CASCADE;
+$$;
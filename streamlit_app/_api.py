@@ -0,0 +1,227 @@
+"""
+Backend API helpers and widget callbacks shared by the Streamlit apps
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+BACKEND_BASE_URL = os.getenv("BACKEND_BASE_URL", "http://localhost:8000")
+ONTOLOGY_REFRESH_SECONDS = 5
+POOL_SIZE = 32
+APPROVAL_WORKERS = 16
+UPLOAD_WORKERS = 8
+
+EMPTY_ONTOLOGY = {"entities": [], "relations": [], "instances": []}
+
+__all__ = [
+    "BACKEND_BASE_URL",
+    "get_client",
+    "fetch_ontology_data",
+    "fetch_proposals",
+    "approve",
+    "approve_many",
+    "chat",
+    "stream_chat",
+    "upload",
+    "on_send",
+    "on_clear_chat",
+    "on_decide",
+]
+
+_refresh_lock = threading.Lock()
+_refreshed_at = 0.0
+
+
+@st.cache_resource
+def get_client() -> requests.Session:
+    """Session shared by every backend call so connections are reused"""
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _request_ontology() -> Dict[str, Any]:
+    global _refreshed_at
+
+    r = get_client().get(f"{BACKEND_BASE_URL}/api/ontology", timeout=5)
+    r.raise_for_status()
+    data = orjson.loads(r.content)
+    with _refresh_lock:
+        _refreshed_at = time.monotonic()
+    return data
+
+
+# Persisted to ~/.streamlit/cache so a restarted server paints the last known
+# ontology immediately. Streamlit ignores ttl on disk caches, so freshness is
+# handled by _revalidate_ontology instead; _seed lets it store a payload it
+# already fetched (underscore args are not part of the cache key).
+@st.cache_data(persist="disk", max_entries=4, show_spinner=False)
+def _ontology_snapshot(_seed: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return _seed if _seed is not None else _request_ontology()
+
+
+def _revalidate_ontology():
+    try:
+        data = _request_ontology()
+    except Exception:
+        return
+    _ontology_snapshot.clear()
+    _ontology_snapshot(_seed=data)
+
+
+def fetch_ontology_data() -> Dict[str, Any]:
+    """Return the cached ontology, refreshing it in the background when stale"""
+    global _refreshed_at
+
+    # Read the snapshot first: a cache miss fetches synchronously and marks
+    # the data fresh, so it doesn't also start a background revalidation
+    try:
+        data = _ontology_snapshot()
+    except Exception:
+        data = EMPTY_ONTOLOGY
+
+    with _refresh_lock:
+        now = time.monotonic()
+        if now - _refreshed_at > ONTOLOGY_REFRESH_SECONDS:
+            _refreshed_at = now
+            worker = threading.Thread(target=_revalidate_ontology, daemon=True)
+            add_script_run_ctx(worker)
+            worker.start()
+
+    return data
+
+
+@st.cache_data(ttl=2, show_spinner=False)
+def fetch_proposals() -> List[Dict[str, Any]]:
+    """Fetch pending proposals"""
+    try:
+        r = get_client().get(f"{BACKEND_BASE_URL}/api/proposals", timeout=5)
+        if r.ok:
+            return orjson.loads(r.content).get("proposals", [])
+    except Exception:
+        pass
+    return []
+
+
+def approve(proposal_id: str, action: str) -> bool:
+    """Approve or reject a single proposal, returning whether the backend accepted it"""
+    try:
+        r = get_client().post(
+            f"{BACKEND_BASE_URL}/api/proposals/approve",
+            json={"proposal_id": proposal_id, "action": action},
+            timeout=5
+        )
+        return r.ok
+    except Exception:
+        return False
+
+
+def approve_many(proposal_ids: Iterable[str], action: str) -> List[str]:
+    """Apply the same action to several proposals concurrently, returning the ids that failed"""
+    proposal_ids = list(proposal_ids)
+    if not proposal_ids:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(APPROVAL_WORKERS, len(proposal_ids))) as executor:
+        futures = {executor.submit(approve, pid, action): pid for pid in proposal_ids}
+        return [futures[future] for future in as_completed(futures) if not future.result()]
+
+
+def chat(message: str) -> str:
+    """Send a chat message and return the assistant's reply"""
+    try:
+        r = get_client().post(
+            f"{BACKEND_BASE_URL}/api/chat",
+            json={"message": message},
+            timeout=10
+        )
+        if r.ok:
+            return r.json().get("text", "No response")
+        return "Sorry, I couldn't process that request."
+    except Exception:
+        return "Connection error. Please check the backend."
+
+
+def stream_chat(message: str) -> Iterator[str]:
+    """Yield the assistant's reply in chunks as the backend streams it"""
+    try:
+        with get_client().post(
+            f"{BACKEND_BASE_URL}/api/chat/stream",
+            json={"message": message},
+            stream=True,
+            timeout=30
+        ) as r:
+            if not r.ok:
+                yield "Sorry, I couldn't process that request."
+                return
+            for line in r.iter_lines():
+                if line.startswith(b"data: "):
+                    yield orjson.loads(line[len(b"data: "):])
+    except Exception:
+        yield "Connection error. Please check the backend."
+
+
+def _upload_one(name: str, content: bytes, mime: str, options: Dict[str, Any]) -> Optional[str]:
+    try:
+        r = get_client().post(
+            f"{BACKEND_BASE_URL}/api/upload-json",
+            files={"file": (name, content, mime)},
+            data=options,
+            timeout=30
+        )
+        return None if r.ok else (r.text or "Failed")
+    except Exception as e:
+        return str(e)
+
+
+def upload(files: Iterable[Any], options: Dict[str, Any]) -> Iterator[Tuple[str, Optional[str]]]:
+    """Upload Streamlit files concurrently, yielding (filename, error) as each finishes"""
+    # Read every buffer up front; UploadedFile objects stay on the script thread
+    payloads = [(file.name, file.getvalue(), file.type) for file in files]
+    if not payloads:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(UPLOAD_WORKERS, len(payloads))) as executor:
+        futures = {
+            executor.submit(_upload_one, name, content, mime, options): name
+            for name, content, mime in payloads
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+# Widget callbacks run before the rerun Streamlit already schedules for the
+# click, so they don't need a trailing st.rerun()
+def on_send():
+    """Send the chat_input text and record both sides in st.session_state.messages"""
+    user_input = st.session_state.chat_input
+    if not user_input:
+        return
+
+    st.session_state.messages.append({"role": "user", "content": user_input})
+    st.session_state.messages.append({"role": "assistant", "content": chat(user_input)})
+    st.session_state.chat_input = ""
+
+
+def on_clear_chat():
+    """Forget the chat history"""
+    st.session_state.messages = []
+
+
+def on_decide(proposal_ids: Iterable[str], action: str):
+    """Apply action to the given proposals, toasting any failures"""
+    failed = approve_many(proposal_ids, action)
+    if failed:
+        st.toast(f"Failed to {action} {len(failed)} proposal(s)")
+    st.cache_data.clear()
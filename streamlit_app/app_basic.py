@@ -1,12 +1,10 @@
-import os
 import json
-import requests
+import orjson
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
 import time
-
-BACKEND_BASE_URL = os.getenv("BACKEND_BASE_URL", "http://localhost:8000")
+from _api import fetch_ontology_data, fetch_proposals, upload, on_send, on_clear_chat, on_decide
 
 # Basic page config - no styling
 st.set_page_config(
@@ -18,22 +16,6 @@ st.set_page_config(
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-@st.cache_data(ttl=30)
-def fetch_ontology_data():
-    try:
-        response = requests.get(f"{BACKEND_BASE_URL}/api/ontology", timeout=5)
-        return response.json() if response.ok else {}
-    except:
-        return {}
-
-@st.cache_data(ttl=10)
-def fetch_proposals():
-    try:
-        response = requests.get(f"{BACKEND_BASE_URL}/api/proposals", timeout=5)
-        return response.json() if response.ok else []
-    except:
-        return []
-
 def create_simple_graph(ontology_data):
     entities = ontology_data.get("entities", [])
     relations = ontology_data.get("relations", [])
@@ -44,17 +26,17 @@ def create_simple_graph(ontology_data):
     # Simple scatter plot
     fig = go.Figure()
     
-    # Add nodes
-    for i, entity in enumerate(entities):
-        fig.add_trace(go.Scatter(
-            x=[i % 5], 
-            y=[i // 5],
-            mode='markers+text',
-            text=[entity.get('name', 'Unknown')],
-            textposition="middle center",
-            marker=dict(size=20, color='blue'),
-            name=entity.get('type', 'Entity')
-        ))
+    # Add nodes as a single trace on a 5-wide grid
+    fig.add_trace(go.Scatter(
+        x=[i % 5 for i in range(len(entities))],
+        y=[i // 5 for i in range(len(entities))],
+        mode='markers+text',
+        text=[e.get('name', 'Unknown') for e in entities],
+        textposition="middle center",
+        marker=dict(size=20, color='blue'),
+        hovertext=[e.get('type', 'Entity') for e in entities],
+        hoverinfo='text'
+    ))
     
     fig.update_layout(
         title="Knowledge Graph",
@@ -86,37 +68,23 @@ def main():
     
     st.markdown("---")
     
-    # Simple tabs
-    tab1, tab2, tab3 = st.tabs(["Chat", "Graph", "Upload"])
+    # Simple views - a radio instead of st.tabs so only the visible view runs
+    active_view = st.radio(
+        "View",
+        ["Chat", "Graph", "Upload"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_view"
+    )
     
-    with tab1:
+    if active_view == "Chat":
         st.header("Chat")
         
         # Chat input
-        user_input = st.text_input("Ask about your data:")
+        st.text_input("Ask about your data:", key="chat_input")
         
-        if st.button("Send") and user_input:
-            st.session_state.messages.append({"role": "user", "content": user_input})
-            
-            try:
-                response = requests.post(
-                    f"{BACKEND_BASE_URL}/api/chat",
-                    json={"message": user_input},
-                    timeout=10
-                )
-                if response.ok:
-                    ai_response = response.json().get("text", "No response")
-                else:
-                    ai_response = "Sorry, I couldn't process that request."
-            except:
-                ai_response = "Connection error. Please check the backend."
-            
-            st.session_state.messages.append({"role": "assistant", "content": ai_response})
-            st.rerun()
-        
-        if st.button("Clear Chat"):
-            st.session_state.messages = []
-            st.rerun()
+        st.button("Send", on_click=on_send)
+        st.button("Clear Chat", on_click=on_clear_chat)
         
         # Display messages
         if st.session_state.messages:
@@ -127,7 +95,7 @@ def main():
         else:
             st.info("Start a conversation!")
     
-    with tab2:
+    elif active_view == "Graph":
         st.header("Knowledge Graph")
         
         fig = create_simple_graph(ontology_data)
@@ -136,7 +104,7 @@ def main():
         else:
             st.info("No data to visualize yet.")
     
-    with tab3:
+    elif active_view == "Upload":
         st.header("Upload Files")
         
         uploaded_files = st.file_uploader(
@@ -154,30 +122,18 @@ def main():
             if st.button("Process Files"):
                 progress = st.progress(0)
                 
-                for i, file in enumerate(uploaded_files):
-                    st.write(f"Processing {file.name}...")
+                options = {
+                    "extract_ontology": extract_ontology,
+                    "auto_approve": auto_approve
+                }
+                
+                for i, (name, error) in enumerate(upload(uploaded_files, options)):
                     progress.progress((i + 1) / len(uploaded_files))
                     
-                    try:
-                        files = {"file": (file.name, file.getvalue(), file.type)}
-                        data = {
-                            "extract_ontology": extract_ontology,
-                            "auto_approve": auto_approve
-                        }
-                        
-                        response = requests.post(
-                            f"{BACKEND_BASE_URL}/api/upload-json",
-                            files=files,
-                            data=data,
-                            timeout=30
-                        )
-                        
-                        if response.ok:
-                            st.success(f"✅ {file.name}")
-                        else:
-                            st.error(f"❌ {file.name}: Failed")
-                    except Exception as e:
-                        st.error(f"❌ {file.name}: {str(e)}")
+                    if error:
+                        st.error(f"❌ {name}: {error}")
+                    else:
+                        st.success(f"✅ {name}")
                 
                 st.success("Processing complete!")
                 st.cache_data.clear()
@@ -188,70 +144,28 @@ def main():
         if proposals:
             st.write("**Pending Approvals:**")
             
+            proposal_ids = [p["id"] for p in proposals]
             col1, col2 = st.columns(2)
             with col1:
-                if st.button("Approve All"):
-                    for p in proposals:
-                        try:
-                            requests.post(
-                                f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                json={"proposal_id": p["id"], "action": "approve"},
-                                timeout=5
-                            )
-                        except:
-                            pass
-                    st.success("All approved!")
-                    st.cache_data.clear()
-                    st.rerun()
+                st.button("Approve All", on_click=on_decide, args=(proposal_ids, "approve"))
             
             with col2:
-                if st.button("Reject All"):
-                    for p in proposals:
-                        try:
-                            requests.post(
-                                f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                json={"proposal_id": p["id"], "action": "reject"},
-                                timeout=5
-                            )
-                        except:
-                            pass
-                    st.success("All rejected!")
-                    st.cache_data.clear()
-                    st.rerun()
+                st.button("Reject All", on_click=on_decide, args=(proposal_ids, "reject"))
             
             # Show individual proposals
             for i, proposal in enumerate(proposals[:3]):
                 st.write(f"**Proposal {i+1}:**")
-                st.json(proposal.get('payload', {}))
+                st.code(orjson.dumps(proposal.get('payload', {}), option=orjson.OPT_INDENT_2).decode(),
+                        language="json")
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    if st.button("Approve", key=f"app_{i}"):
-                        try:
-                            requests.post(
-                                f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                json={"proposal_id": proposal["id"], "action": "approve"},
-                                timeout=5
-                            )
-                            st.success("Approved!")
-                            st.cache_data.clear()
-                            st.rerun()
-                        except:
-                            st.error("Failed")
+                    st.button("Approve", key=f"app_{i}", on_click=on_decide,
+                              args=([proposal["id"]], "approve"))
                 
                 with col2:
-                    if st.button("Reject", key=f"rej_{i}"):
-                        try:
-                            requests.post(
-                                f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                json={"proposal_id": proposal["id"], "action": "reject"},
-                                timeout=5
-                            )
-                            st.success("Rejected!")
-                            st.cache_data.clear()
-                            st.rerun()
-                        except:
-                            st.error("Failed")
+                    st.button("Reject", key=f"rej_{i}", on_click=on_decide,
+                              args=([proposal["id"]], "reject"))
         else:
             st.success("No pending approvals!")
     
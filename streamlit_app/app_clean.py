@@ -1,14 +1,13 @@
-import os
 import json
-import requests
+import orjson
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 import time
 import math
 import random
-
-BACKEND_BASE_URL = os.getenv("BACKEND_BASE_URL", "http://localhost:8000")
+from _api import fetch_ontology_data, fetch_proposals, upload, on_send, on_clear_chat, on_decide
 
 # Configure page
 st.set_page_config(
@@ -69,24 +68,6 @@ st.markdown("""
         background: #f1f5f9;
     }
     
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 10px;
-        background: #e2e8f0;
-        border-radius: 10px;
-        padding: 5px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 8px;
-        padding: 10px 20px;
-        font-weight: 500;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: white;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-    }
-    
     /* Hide Streamlit elements */
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
@@ -95,27 +76,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Data functions
-@st.cache_data(ttl=5)
-def fetch_ontology_data():
-    try:
-        r = requests.get(f"{BACKEND_BASE_URL}/api/ontology", timeout=5)
-        if r.ok:
-            return r.json()
-    except:
-        pass
-    return {"entities": [], "relations": [], "instances": []}
-
-@st.cache_data(ttl=2)
-def fetch_proposals():
-    try:
-        r = requests.get(f"{BACKEND_BASE_URL}/api/proposals", timeout=5)
-        if r.ok:
-            return r.json().get("proposals", [])
-    except:
-        pass
-    return []
-
 def create_knowledge_graph(data, node_size=25, edge_width=2, show_labels=True):
     entities = data.get("entities", [])
     relations = data.get("relations", [])
@@ -161,23 +121,27 @@ def create_knowledge_graph(data, node_size=25, edge_width=2, show_labels=True):
         node_color.append('#9b59b6')
         node_hover.append(f"<b>{name}</b><br>Type: Instance")
     
-    # Create edges
-    edge_x, edge_y = [], []
+    # Create edges: resolve endpoints to node indices (-1 when unknown), then
+    # gather coordinates in one pass; NaN breaks the line between segments
+    node_x, node_y = np.asarray(node_x), np.asarray(node_y)
     entity_map = {e.get('id'): i for i, e in enumerate(entities)}
     
-    for relation in relations:
-        src, tgt = relation.get('source'), relation.get('target')
-        if src in entity_map and tgt in entity_map:
-            src_idx, tgt_idx = entity_map[src], entity_map[tgt]
-            if src_idx < len(node_x) and tgt_idx < len(node_x):
-                edge_x.extend([node_x[src_idx], node_x[tgt_idx], None])
-                edge_y.extend([node_y[src_idx], node_y[tgt_idx], None])
+    src_idx = np.fromiter((entity_map.get(r.get('source'), -1) for r in relations),
+                          dtype=np.int32, count=len(relations))
+    tgt_idx = np.fromiter((entity_map.get(r.get('target'), -1) for r in relations),
+                          dtype=np.int32, count=len(relations))
+    valid = (src_idx >= 0) & (tgt_idx >= 0)
+    src_idx, tgt_idx = src_idx[valid], tgt_idx[valid]
+    
+    gap = np.full(len(src_idx), np.nan)
+    edge_x = np.stack([node_x[src_idx], node_x[tgt_idx], gap], axis=1).ravel()
+    edge_y = np.stack([node_y[src_idx], node_y[tgt_idx], gap], axis=1).ravel()
     
     # Create figure
     fig = go.Figure()
     
     # Add edges
-    if edge_x:
+    if edge_x.size:
         fig.add_trace(go.Scatter(
             x=edge_x, y=edge_y,
             mode='lines',
@@ -271,44 +235,32 @@ def main():
     
     st.markdown("<br>", unsafe_allow_html=True)
 
-    # Main tabs
-    tab1, tab2, tab3 = st.tabs(["💬 Chat", "🕸️ Graph", "📁 Upload"])
+    # Main views - a radio instead of st.tabs so only the visible view runs
+    # (tabs execute every body on each rerun, including the graph build)
+    active_view = st.radio(
+        "View",
+        ["💬 Chat", "🕸️ Graph", "📁 Upload"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_view"
+    )
 
-    with tab1:
+    if active_view == "💬 Chat":
         st.subheader("AI Assistant")
 
         # Chat input
-        user_input = st.text_input(
+        st.text_input(
             "Ask about your data:",
-            placeholder="e.g., 'What entities do we have?' or 'Show me the relationships'"
+            placeholder="e.g., 'What entities do we have?' or 'Show me the relationships'",
+            key="chat_input"
         )
 
         col1, col2, col3 = st.columns([1, 1, 2])
         with col1:
-            if st.button("Send", type="primary") and user_input:
-                st.session_state.messages.append({"role": "user", "content": user_input})
-
-                with st.spinner("Processing..."):
-                    try:
-                        response = requests.post(
-                            f"{BACKEND_BASE_URL}/api/chat",
-                            json={"message": user_input},
-                            timeout=10
-                        )
-                        if response.ok:
-                            ai_response = response.json().get("text", "No response")
-                        else:
-                            ai_response = "Sorry, I couldn't process that request."
-                    except:
-                        ai_response = "Connection error. Please check the backend."
-
-                st.session_state.messages.append({"role": "assistant", "content": ai_response})
-                st.rerun()
+            st.button("Send", type="primary", on_click=on_send)
 
         with col2:
-            if st.button("Clear Chat"):
-                st.session_state.messages = []
-                st.rerun()
+            st.button("Clear Chat", on_click=on_clear_chat)
 
         # Display messages
         if st.session_state.messages:
@@ -323,7 +275,7 @@ def main():
         else:
             st.info("👋 Start a conversation! Ask about entities, relationships, or upload documents.")
 
-    with tab2:
+    elif active_view == "🕸️ Graph":
         st.subheader("Knowledge Graph")
 
         # Graph controls
@@ -356,7 +308,7 @@ def main():
                 - 🟣 Instance data
                 """)
 
-    with tab3:
+    elif active_view == "📁 Upload":
         st.subheader("Document Upload")
 
         col1, col2 = st.columns(2)
@@ -382,30 +334,19 @@ def main():
                     progress = st.progress(0)
                     status = st.empty()
 
-                    for i, file in enumerate(uploaded_files):
-                        status.text(f"Processing {file.name}...")
+                    options = {
+                        "extract_ontology": extract_ontology,
+                        "auto_approve": auto_approve
+                    }
+
+                    for i, (name, error) in enumerate(upload(uploaded_files, options)):
+                        status.text(f"Processed {name}")
                         progress.progress((i + 1) / len(uploaded_files))
 
-                        try:
-                            files = {"file": (file.name, file.getvalue(), file.type)}
-                            data = {
-                                "extract_ontology": extract_ontology,
-                                "auto_approve": auto_approve
-                            }
-
-                            response = requests.post(
-                                f"{BACKEND_BASE_URL}/api/upload-json",
-                                files=files,
-                                data=data,
-                                timeout=30
-                            )
-
-                            if response.ok:
-                                st.success(f"✅ {file.name}")
-                            else:
-                                st.error(f"❌ {file.name}: Failed")
-                        except Exception as e:
-                            st.error(f"❌ {file.name}: {str(e)}")
+                        if error:
+                            st.error(f"❌ {name}: {error}")
+                        else:
+                            st.success(f"✅ {name}")
 
                     status.text("✅ Processing complete!")
                     st.cache_data.clear()
@@ -419,72 +360,30 @@ def main():
                 st.success("🎉 No pending approvals!")
             else:
                 # Bulk actions
+                proposal_ids = [p["id"] for p in proposals]
                 col_a, col_b = st.columns(2)
                 with col_a:
-                    if st.button("✅ Approve All"):
-                        for p in proposals:
-                            try:
-                                requests.post(
-                                    f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                    json={"proposal_id": p["id"], "action": "approve"},
-                                    timeout=5
-                                )
-                            except:
-                                pass
-                        st.success("All approved!")
-                        st.cache_data.clear()
-                        st.rerun()
+                    st.button("✅ Approve All", on_click=on_decide, args=(proposal_ids, "approve"))
 
                 with col_b:
-                    if st.button("❌ Reject All"):
-                        for p in proposals:
-                            try:
-                                requests.post(
-                                    f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                    json={"proposal_id": p["id"], "action": "reject"},
-                                    timeout=5
-                                )
-                            except:
-                                pass
-                        st.success("All rejected!")
-                        st.cache_data.clear()
-                        st.rerun()
+                    st.button("❌ Reject All", on_click=on_decide, args=(proposal_ids, "reject"))
 
                 st.markdown("---")
 
                 # Individual proposals
                 for i, proposal in enumerate(proposals[:3]):
                     with st.expander(f"Proposal {i+1}: {proposal.get('type', 'Unknown')}"):
-                        st.json(proposal.get('payload', {}))
+                        st.code(orjson.dumps(proposal.get('payload', {}), option=orjson.OPT_INDENT_2).decode(),
+                                language="json")
 
                         col_x, col_y = st.columns(2)
                         with col_x:
-                            if st.button("✅ Approve", key=f"app_{i}"):
-                                try:
-                                    requests.post(
-                                        f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                        json={"proposal_id": proposal["id"], "action": "approve"},
-                                        timeout=5
-                                    )
-                                    st.success("Approved!")
-                                    st.cache_data.clear()
-                                    st.rerun()
-                                except:
-                                    st.error("Failed")
+                            st.button("✅ Approve", key=f"app_{i}", on_click=on_decide,
+                                      args=([proposal["id"]], "approve"))
 
                         with col_y:
-                            if st.button("❌ Reject", key=f"rej_{i}"):
-                                try:
-                                    requests.post(
-                                        f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                        json={"proposal_id": proposal["id"], "action": "reject"},
-                                        timeout=5
-                                    )
-                                    st.success("Rejected!")
-                                    st.cache_data.clear()
-                                    st.rerun()
-                                except:
-                                    st.error("Failed")
+                            st.button("❌ Reject", key=f"rej_{i}", on_click=on_decide,
+                                      args=([proposal["id"]], "reject"))
 
                 if len(proposals) > 3:
                     st.info(f"... and {len(proposals) - 3} more proposals")
@@ -1,14 +1,27 @@
 import os
+import html
 import json
-import requests
+import ijson
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
+import networkx as nx
 from datetime import datetime, timedelta
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from _api import approve_many, fetch_proposals, get_client, stream_chat, upload
 
 BACKEND_BASE_URL = os.getenv("BACKEND_BASE_URL", "http://localhost:8000")
+MAX_DRAWN_EDGES = 1000
+DEFAULT_MAX_NODES = 500
+MAX_NODES_LIMIT = 2000
+# Kept under networkx's 500-node switch to its much slower scipy solver
+FORCE_LAYOUT_MAX_NODES = 300
+FORCE_LAYOUT_ITERATIONS = 30
 
 # Configure page
 st.set_page_config(
@@ -17,107 +30,123 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for unified interface
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(90deg, #1f4e79, #2d5aa0);
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    .main-header h1 {
-        color: white;
-        margin: 0;
-        font-size: 2.5rem;
-    }
-    .main-header p {
-        color: #e3f2fd;
-        margin: 0.5rem 0 0 0;
-        font-size: 1.1rem;
-    }
-    .section-card {
-        background: #fff;
-        border: 1px solid #dee2e6;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    .approval-item {
-        background: #f8f9fa;
-        border-left: 4px solid #2d5aa0;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 0 8px 8px 0;
-    }
-    .metric-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-    .chat-message {
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 8px;
-    }
-    .user-message {
-        background: #e3f2fd;
-        border-left: 4px solid #2d5aa0;
-    }
-    .assistant-message {
-        background: #f1f8e9;
-        border-left: 4px solid #28a745;
-    }
-    .stButton > button {
-        border-radius: 6px;
-        border: none;
-        padding: 0.5rem 1rem;
-        font-weight: 500;
-    }
-    .approve-btn {
-        background-color: #28a745 !important;
-        color: white !important;
-    }
-    .reject-btn {
-        background-color: #dc3545 !important;
-        color: white !important;
-    }
-    .bulk-btn {
-        background-color: #007bff !important;
-        color: white !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for unified interface, read once per server process
+@st.cache_resource
+def _load_css():
+    with open(os.path.join(os.path.dirname(__file__), "app_unified.css")) as f:
+        return f"<style>\n{f.read()}</style>"
+
+st.markdown(_load_css(), unsafe_allow_html=True)
 
 # Helper functions
-@st.cache_data(ttl=5)
+@st.cache_data(ttl=5, show_spinner=False)
 def fetch_ontology_data():
     """Fetch current ontology structure from backend"""
     try:
-        r = requests.get(f"{BACKEND_BASE_URL}/api/ontology/structure")
-        if r.ok:
-            return r.json()
+        # Parse top-level entries as the body streams in instead of buffering
+        # the whole payload and decoding it in one go
+        with get_client().get(f"{BACKEND_BASE_URL}/api/ontology/structure", stream=True, timeout=5) as r:
+            if r.ok:
+                r.raw.decode_content = True
+                return dict(ijson.kvitems(r.raw, "", use_float=True))
     except:
         pass
     return {"entities": [], "relations": [], "instances": []}
 
-@st.cache_data(ttl=2)
-def fetch_proposals():
-    """Fetch pending proposals"""
+def fetch_dashboard_data():
+    """Fetch the ontology and pending proposals with both GETs in flight at once"""
+    # Workers get the script's context so the cached fetchers run as they would inline
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        ontology_future = executor.submit(fetch_ontology_data)
+        proposals_future = executor.submit(fetch_proposals)
+        return ontology_future.result(), proposals_future.result()
+
+def circular_layout(entity_count, instance_count):
+    """Entities on the outer ring, instances on an inner ring at half the radius"""
+    total_nodes = entity_count + instance_count
+    angles = np.linspace(0, 2 * np.pi, total_nodes, endpoint=False)
+    radius = np.ones(total_nodes)
+    radius[entity_count:] = 0.5
+    return radius * np.cos(angles), radius * np.sin(angles)
+
+def node_keys(node):
+    """Keys a relation may use to refer to a node: its name and its id"""
+    return [str(key) for key in (node.get("name"), node.get("id")) if key is not None]
+
+def relation_endpoints(relation):
+    """A relation's (source, target) keys; stored relations only carry entity ids"""
+    source = relation.get("source", relation.get("source_entity_id"))
+    target = relation.get("target", relation.get("target_entity_id"))
+    return (
+        None if source is None else str(source),
+        None if target is None else str(target),
+    )
+
+def relation_edges(entities, relations):
+    """Relations as (source, target) entity indices, skipping unknown endpoints"""
+    key_to_idx = {key: i for i, entity in enumerate(entities) for key in node_keys(entity)}
+    edges = []
+    for relation in relations:
+        source, target = relation_endpoints(relation)
+        if source in key_to_idx and target in key_to_idx:
+            edges.append((key_to_idx[source], key_to_idx[target]))
+    return tuple(edges)
+
+# A cache resource rather than cache data: the result is fully determined by
+# its key (fixed seed), so it never expires and survives st.cache_data.clear()
+@st.cache_resource(max_entries=16, show_spinner=False)
+def compute_graph_layout(entity_count, instance_count, edges):
+    """Force-directed node positions, seeded from the circular layout.
+
+    Keyed on node counts and edge indices only. Graphs above
+    FORCE_LAYOUT_MAX_NODES keep the circular layout, so no rerun waits
+    more than a fraction of a second on spring_layout.
+    """
+    node_x, node_y = circular_layout(entity_count, instance_count)
+    if not edges or len(node_x) > FORCE_LAYOUT_MAX_NODES:
+        return node_x, node_y
+
+    graph = nx.Graph()
+    graph.add_nodes_from(range(len(node_x)))
+    graph.add_edges_from(edges)
+    initial = {i: (node_x[i], node_y[i]) for i in range(len(node_x))}
     try:
-        r = requests.get(f"{BACKEND_BASE_URL}/api/proposals")
-        if r.ok:
-            return r.json().get("proposals", [])
-    except:
-        pass
-    return []
+        pos = nx.spring_layout(graph, pos=initial, iterations=FORCE_LAYOUT_ITERATIONS, seed=42)
+    except Exception:
+        # A layout failure should never take the page down
+        return node_x, node_y
+
+    coords = np.array([pos[i] for i in range(len(node_x))])
+    return coords[:, 0], coords[:, 1]
+
+def top_degree_subgraph(entities, relations, instances, max_nodes):
+    """Keep the max_nodes best-connected nodes and the relations between them"""
+    if len(entities) + len(instances) <= max_nodes:
+        return entities, relations, instances
 
-def create_network_graph(ontology_data):
+    degree = Counter()
+    for relation in relations:
+        degree.update(relation_endpoints(relation))
+
+    # sorted() is stable, so ties keep entities ahead of instances
+    nodes = [("entity", e) for e in entities] + [("instance", i) for i in instances]
+    kept = sorted(
+        nodes,
+        key=lambda node: sum(degree[key] for key in node_keys(node[1])),
+        reverse=True
+    )[:max_nodes]
+
+    kept_entities = [node for kind, node in kept if kind == "entity"]
+    kept_instances = [node for kind, node in kept if kind == "instance"]
+    kept_keys = {key for _, node in kept for key in node_keys(node)}
+    kept_relations = [
+        r for r in relations
+        if all(endpoint in kept_keys for endpoint in relation_endpoints(r))
+    ]
+    return kept_entities, kept_relations, kept_instances
+
+def create_network_graph(ontology_data, max_nodes=DEFAULT_MAX_NODES):
     """Create a simple network graph using plotly"""
     entities = ontology_data.get("entities", [])
     relations = ontology_data.get("relations", [])
@@ -126,46 +155,32 @@ def create_network_graph(ontology_data):
     if not entities and not relations:
         return None
     
-    # Create nodes and edges for plotly graph
-    node_x = []
-    node_y = []
-    node_text = []
-    node_color = []
-    
-    # Simple circular layout
-    import math
-    total_nodes = len(entities) + len(instances)
+    entities, relations, instances = top_degree_subgraph(entities, relations, instances, max_nodes)
     
-    for i, entity in enumerate(entities):
-        angle = 2 * math.pi * i / max(total_nodes, 1)
-        node_x.append(math.cos(angle))
-        node_y.append(math.sin(angle))
-        node_text.append(f"Entity: {entity['name']}")
-        node_color.append('#2d5aa0')
+    # Node positions
+    edges = relation_edges(entities, relations)
+    node_x, node_y = compute_graph_layout(len(entities), len(instances), edges)
     
-    for i, instance in enumerate(instances):
-        angle = 2 * math.pi * (i + len(entities)) / max(total_nodes, 1)
-        node_x.append(0.5 * math.cos(angle))
-        node_y.append(0.5 * math.sin(angle))
-        node_text.append(f"Instance: {instance['name'][:20]}...")
-        node_color.append('#ffc107')
+    node_text = [f"Entity: {entity['name']}" for entity in entities]
+    node_text += [f"Instance: {instance['name'][:20]}..." for instance in instances]
+    node_color = ['#2d5aa0'] * len(entities) + ['#ffc107'] * len(instances)
     
-    # Create edges
-    edge_x = []
-    edge_y = []
+    # Create edges: each one is its source and target coordinates followed by
+    # a NaN break; at most MAX_DRAWN_EDGES are drawn, the rest only counted
+    drawn_edges = np.array(edges[:MAX_DRAWN_EDGES], dtype=int).reshape(-1, 2)
+    hidden_edges = len(edges) - len(drawn_edges)
     
-    for relation in relations:
-        # Simple connection lines (would need proper node mapping in real implementation)
-        if len(node_x) >= 2:
-            edge_x.extend([node_x[0], node_x[1], None])
-            edge_y.extend([node_y[0], node_y[1], None])
+    edge_x = np.empty(len(drawn_edges) * 3)
+    edge_y = np.empty(len(drawn_edges) * 3)
+    edge_x[0::3], edge_x[1::3], edge_x[2::3] = node_x[drawn_edges[:, 0]], node_x[drawn_edges[:, 1]], np.nan
+    edge_y[0::3], edge_y[1::3], edge_y[2::3] = node_y[drawn_edges[:, 0]], node_y[drawn_edges[:, 1]], np.nan
     
     # Create plotly figure
     fig = go.Figure()
     
-    # Add edges
-    if edge_x:
-        fig.add_trace(go.Scatter(
+    # Add edges (WebGL traces scale to thousands of points)
+    if len(edge_x):
+        fig.add_trace(go.Scattergl(
             x=edge_x, y=edge_y,
             line=dict(width=2, color='#666'),
             hoverinfo='none',
@@ -174,7 +189,7 @@ def create_network_graph(ontology_data):
         ))
     
     # Add nodes
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=node_x, y=node_y,
         mode='markers+text',
         hoverinfo='text',
@@ -188,26 +203,56 @@ def create_network_graph(ontology_data):
         showlegend=False
     ))
     
+    annotations = [ dict(
+        text="Interactive ontology visualization",
+        showarrow=False,
+        xref="paper", yref="paper",
+        x=0.005, y=-0.002,
+        xanchor='left', yanchor='bottom',
+        font=dict(color='#666', size=12)
+    )]
+    if hidden_edges:
+        annotations.append(dict(
+            text=f"... +{hidden_edges} more relations",
+            showarrow=False,
+            xref="paper", yref="paper",
+            x=0.995, y=-0.002,
+            xanchor='right', yanchor='bottom',
+            font=dict(color='#666', size=12)
+        ))
+    
     fig.update_layout(
         title="Ontology Network Graph",
         showlegend=False,
         hovermode='closest',
         margin=dict(b=20,l=5,r=5,t=40),
-        annotations=[ dict(
-            text="Interactive ontology visualization",
-            showarrow=False,
-            xref="paper", yref="paper",
-            x=0.005, y=-0.002,
-            xanchor='left', yanchor='bottom',
-            font=dict(color='#666', size=12)
-        )],
+        annotations=annotations,
         xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
         yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        height=400
+        height=400,
+        # Keep the user's pan/zoom when the figure is re-sent on a rerun
+        uirevision="ontology-graph"
     )
     
     return fig
 
+def _graph_signature(ontology_data):
+    """Cheap cache key for the graph: element counts plus node names"""
+    entities = ontology_data.get("entities", [])
+    relations = ontology_data.get("relations", [])
+    instances = ontology_data.get("instances", [])
+    return (
+        len(entities), len(relations), len(instances),
+        tuple(e.get("name") for e in entities),
+        tuple(i.get("name") for i in instances),
+    )
+
+# The ontology itself is passed as _ontology_data so Streamlit skips hashing
+# it and keys the cached figure on the signature and node cap alone
+@st.cache_data(ttl=10, show_spinner=False)
+def build_network_graph(signature, max_nodes, _ontology_data):
+    return create_network_graph(_ontology_data, max_nodes)
+
 # Initialize session state
 if "chat_history" not in st.session_state:
     st.session_state.chat_history = []
@@ -220,44 +265,117 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Get current data
-ontology_data = fetch_ontology_data()
-proposals = fetch_proposals()
+# With auto-refresh on, only the live panels below rerun every 5s (as
+# fragments) instead of the whole script sleeping and calling st.rerun()
+LIVE_REFRESH = "5s" if st.session_state.get("auto_refresh") else None
+
+@st.fragment(run_every=LIVE_REFRESH)
+def render_metrics():
+    """Top metrics row"""
+    ontology_data, proposals = fetch_dashboard_data()
+
+    metrics = [
+        (len(ontology_data.get("entities", [])), "Entities"),
+        (len(ontology_data.get("relations", [])), "Relations"),
+        (len(ontology_data.get("instances", [])), "Instances"),
+        (len(proposals), "Pending Approvals"),
+    ]
+
+    # One markdown element for the whole row instead of one per column
+    cards = "".join(
+        f'<div class="metric-box"><h3>{value}</h3><p>{label}</p></div>'
+        for value, label in metrics
+    )
+    st.markdown(f'<div class="metric-row">{cards}</div>', unsafe_allow_html=True)
 
-# Top metrics row
-col1, col2, col3, col4 = st.columns(4)
+# Get current data, with both GETs in flight at once; the metrics fragment
+# below then reads them from the cache, and only fetches (again concurrently)
+# on its own timed reruns
+ontology_data, _ = fetch_dashboard_data()
 
-with col1:
-    st.markdown(f"""
-    <div class="metric-box">
-        <h3>{len(ontology_data.get("entities", []))}</h3>
-        <p>Entities</p>
-    </div>
-    """, unsafe_allow_html=True)
+render_metrics()
 
-with col2:
-    st.markdown(f"""
-    <div class="metric-box">
-        <h3>{len(ontology_data.get("relations", []))}</h3>
-        <p>Relations</p>
-    </div>
-    """, unsafe_allow_html=True)
+@st.fragment(run_every=LIVE_REFRESH)
+def render_approvals():
+    """Pending approvals list with bulk and per-proposal actions"""
+    proposals = fetch_proposals()
 
-with col3:
-    st.markdown(f"""
-    <div class="metric-box">
-        <h3>{len(ontology_data.get("instances", []))}</h3>
-        <p>Instances</p>
-    </div>
-    """, unsafe_allow_html=True)
+    if not proposals:
+        st.success("🎉 No pending approvals!")
+    else:
+        # Bulk actions
+        st.markdown("**Bulk Actions:**")
+        bulk_col1, bulk_col2 = st.columns(2)
 
-with col4:
-    st.markdown(f"""
-    <div class="metric-box">
-        <h3>{len(proposals)}</h3>
-        <p>Pending Approvals</p>
-    </div>
-    """, unsafe_allow_html=True)
+        with bulk_col1:
+            if st.button("✅ Approve All", key="approve_all", help="Approve all pending proposals"):
+                failed = approve_many([p["id"] for p in proposals], "approve")
+                st.success(f"Approved {len(proposals) - len(failed)} proposals!")
+                if failed:
+                    st.error(f"Failed to approve {len(failed)} proposals")
+                st.cache_data.clear()
+                time.sleep(1)
+                st.rerun()
+
+        with bulk_col2:
+            if st.button("❌ Reject All", key="reject_all", help="Reject all pending proposals"):
+                failed = approve_many([p["id"] for p in proposals], "reject")
+                st.success(f"Rejected {len(proposals) - len(failed)} proposals!")
+                if failed:
+                    st.error(f"Failed to reject {len(failed)} proposals")
+                st.cache_data.clear()
+                time.sleep(1)
+                st.rerun()
+
+        st.markdown("---")
+
+        # Individual proposals
+        st.markdown(f"**{len(proposals)} Proposals:**")
+
+        # First 5 proposals as one editable table, decided in a single submit
+        rows = []
+        for p in proposals[:5]:  # Show first 5
+            payload = p.get("payload", {})
+            proposal_type = p.get("type", "Unknown")
+            if proposal_type == "relation":
+                summary = f"🔗 {payload.get('source', 'Unknown')} → {payload.get('target', 'Unknown')}"
+            elif proposal_type == "instance":
+                summary = f"📄 File: {payload.get('source_file_id', 'Unknown')}"
+            else:
+                summary = ""
+            rows.append({"id": p.get("id", "Unknown"), "type": proposal_type,
+                         "summary": summary, "decide": ""})
+
+        with st.form("approvals"):
+            edited = st.data_editor(
+                pd.DataFrame(rows),
+                column_config={
+                    "id": st.column_config.TextColumn("ID", disabled=True),
+                    "type": st.column_config.TextColumn("Type", disabled=True),
+                    "summary": st.column_config.TextColumn("Summary", disabled=True),
+                    "decide": st.column_config.SelectboxColumn("Decide", options=["", "approve", "reject"]),
+                },
+                hide_index=True,
+                use_container_width=True,
+                key="approvals_editor"
+            )
+            submitted = st.form_submit_button("Submit decisions")
+
+        if submitted:
+            decided = edited[edited["decide"].isin(["approve", "reject"])]
+            failed = []
+            for action, group in decided.groupby("decide"):
+                failed += approve_many(group["id"].tolist(), action)
+            if len(decided):
+                st.success(f"Applied {len(decided) - len(failed)} decisions!")
+                if failed:
+                    st.error(f"Failed to apply {len(failed)} decisions")
+                st.cache_data.clear()
+                time.sleep(0.5)
+                st.rerun()
+
+        if len(proposals) > 5:
+            st.info(f"... and {len(proposals) - 5} more proposals")
 
 # Main content area with three columns
 left_col, center_col, right_col = st.columns([1, 1, 1])
@@ -290,36 +408,28 @@ with left_col:
     if st.button("🚀 Send", key="send_chat") and msg:
         st.session_state.chat_history.append({"role": "user", "content": msg})
 
-        with st.spinner("🤔 Thinking..."):
-            try:
-                r = requests.post(f"{BACKEND_BASE_URL}/api/chat", json={"message": msg})
-                if r.ok:
-                    data = r.json()
-                    response = data.get("text", "I couldn't process that request.")
-                    st.session_state.chat_history.append({"role": "assistant", "content": response})
-                else:
-                    st.session_state.chat_history.append({"role": "assistant", "content": "Sorry, I encountered an error."})
-            except:
-                st.session_state.chat_history.append({"role": "assistant", "content": "Connection error. Please try again."})
+        # Show the reply as it streams in rather than behind a spinner
+        response = st.write_stream(stream_chat(msg))
+        st.session_state.chat_history.append({"role": "assistant", "content": response})
         st.rerun()
 
     # Display recent chat messages (last 4)
     if st.session_state.chat_history:
         st.markdown("**Recent Conversation:**")
         recent_messages = st.session_state.chat_history[-4:]
+        # One markdown element for all messages; content is escaped so stray
+        # markup in a message can't break the surrounding divs
+        blocks = []
         for message in recent_messages:
             if message["role"] == "user":
-                st.markdown(f"""
-                <div class="chat-message user-message">
-                    <strong>👤 You:</strong> {message["content"]}
-                </div>
-                """, unsafe_allow_html=True)
+                css_class, speaker = "user-message", "👤 You"
             else:
-                st.markdown(f"""
-                <div class="chat-message assistant-message">
-                    <strong>🤖 Assistant:</strong> {message["content"]}
-                </div>
-                """, unsafe_allow_html=True)
+                css_class, speaker = "assistant-message", "🤖 Assistant"
+            blocks.append(
+                f'<div class="chat-message {css_class}">'
+                f'<strong>{speaker}:</strong> {html.escape(message["content"])}</div>'
+            )
+        st.markdown("".join(blocks), unsafe_allow_html=True)
 
     if st.button("🗑️ Clear Chat", key="clear_chat"):
         st.session_state.chat_history = []
@@ -352,25 +462,19 @@ with center_col:
         progress_bar = st.progress(0)
         status_text = st.empty()
 
-        for i, file in enumerate(uploaded):
-            status_text.text(f"Processing {file.name}...")
-            progress_bar.progress((i + 1) / len(uploaded))
-
-            try:
-                files = {"file": (file.name, file.getvalue(), file.type)}
-                data = {
-                    "extract_ontology": extract_ontology,
-                    "auto_approve": auto_approve
-                }
+        options = {
+            "extract_ontology": extract_ontology,
+            "auto_approve": auto_approve
+        }
 
-                r = requests.post(f"{BACKEND_BASE_URL}/api/upload-json", files=files, data=data)
+        for done, (name, error) in enumerate(upload(uploaded, options), start=1):
+            status_text.text(f"Processed {name} ({done}/{len(uploaded)})")
+            progress_bar.progress(done / len(uploaded))
 
-                if r.ok:
-                    st.success(f"✅ {file.name}")
-                else:
-                    st.error(f"❌ {file.name}: {r.text}")
-            except Exception as e:
-                st.error(f"❌ {file.name}: {str(e)}")
+            if error:
+                st.error(f"❌ {name}: {error}")
+            else:
+                st.success(f"✅ {name}")
 
         status_text.text("✅ Processing complete!")
         st.cache_data.clear()
@@ -384,10 +488,16 @@ with center_col:
     </div>
     """, unsafe_allow_html=True)
 
-    # Create and display graph
-    fig = create_network_graph(ontology_data)
+    # Create and display graph, limited to the best-connected nodes
+    total_nodes = len(ontology_data.get("entities", [])) + len(ontology_data.get("instances", []))
+    max_nodes = st.slider("Max nodes", min_value=50, max_value=MAX_NODES_LIMIT,
+                          value=DEFAULT_MAX_NODES, step=50, key="graph_max_nodes",
+                          help=f"Graphs over {FORCE_LAYOUT_MAX_NODES} nodes use a circular layout")
+    fig = build_network_graph(_graph_signature(ontology_data), max_nodes, ontology_data)
     if fig:
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config={"displaylogo": False})
+        if total_nodes > max_nodes:
+            st.caption(f"Showing top {max_nodes} of {total_nodes} nodes by connections")
     else:
         st.info("📊 Upload documents to see the ontology graph!")
 
@@ -395,7 +505,7 @@ with center_col:
     if ontology_data.get("entities") or ontology_data.get("relations"):
         stats_col1, stats_col2 = st.columns(2)
         with stats_col1:
-            st.metric("Nodes", len(ontology_data.get("entities", [])) + len(ontology_data.get("instances", [])))
+            st.metric("Nodes", total_nodes)
         with stats_col2:
             st.metric("Connections", len(ontology_data.get("relations", [])))
 
@@ -407,97 +517,10 @@ with right_col:
     </div>
     """, unsafe_allow_html=True)
 
-    if not proposals:
-        st.success("🎉 No pending approvals!")
-    else:
-        # Bulk actions
-        st.markdown("**Bulk Actions:**")
-        bulk_col1, bulk_col2 = st.columns(2)
-
-        with bulk_col1:
-            if st.button("✅ Approve All", key="approve_all", help="Approve all pending proposals"):
-                for p in proposals:
-                    try:
-                        requests.post(f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                    json={"proposal_id": p["id"], "action": "approve"})
-                    except:
-                        pass
-                st.success(f"Approved {len(proposals)} proposals!")
-                st.cache_data.clear()
-                time.sleep(1)
-                st.rerun()
-
-        with bulk_col2:
-            if st.button("❌ Reject All", key="reject_all", help="Reject all pending proposals"):
-                for p in proposals:
-                    try:
-                        requests.post(f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                    json={"proposal_id": p["id"], "action": "reject"})
-                    except:
-                        pass
-                st.success(f"Rejected {len(proposals)} proposals!")
-                st.cache_data.clear()
-                time.sleep(1)
-                st.rerun()
-
-        st.markdown("---")
-
-        # Individual proposals
-        st.markdown(f"**{len(proposals)} Proposals:**")
-
-        for i, p in enumerate(proposals[:5]):  # Show first 5
-            proposal_type = p.get('type', 'Unknown')
-            proposal_id = p.get('id', 'Unknown')
-
-            st.markdown(f"""
-            <div class="approval-item">
-                <strong>{proposal_type}</strong> :: {proposal_id[:8]}...
-            </div>
-            """, unsafe_allow_html=True)
+    render_approvals()
 
-            # Show payload summary
-            payload = p.get("payload", {})
-            if proposal_type == "relation":
-                st.write(f"🔗 `{payload.get('source', 'Unknown')}` → `{payload.get('target', 'Unknown')}`")
-            elif proposal_type == "instance":
-                st.write(f"📄 File: `{payload.get('source_file_id', 'Unknown')}`")
-
-            # Action buttons
-            action_col1, action_col2 = st.columns(2)
-            with action_col1:
-                if st.button("✅", key=f"approve_{i}", help="Approve"):
-                    try:
-                        requests.post(f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                    json={"proposal_id": p["id"], "action": "approve"})
-                        st.success("Approved!")
-                        st.cache_data.clear()
-                        time.sleep(0.5)
-                        st.rerun()
-                    except:
-                        st.error("Failed to approve")
-
-            with action_col2:
-                if st.button("❌", key=f"reject_{i}", help="Reject"):
-                    try:
-                        requests.post(f"{BACKEND_BASE_URL}/api/proposals/approve",
-                                    json={"proposal_id": p["id"], "action": "reject"})
-                        st.success("Rejected!")
-                        st.cache_data.clear()
-                        time.sleep(0.5)
-                        st.rerun()
-                    except:
-                        st.error("Failed to reject")
-
-            st.markdown("---")
-
-        if len(proposals) > 5:
-            st.info(f"... and {len(proposals) - 5} more proposals")
-
-# Auto-refresh
-if st.checkbox("🔄 Auto-refresh (5s)", value=False, key="auto_refresh"):
-    time.sleep(5)
-    st.cache_data.clear()
-    st.rerun()
+# Auto-refresh (read back as LIVE_REFRESH at the top of the next run)
+st.checkbox("🔄 Auto-refresh (5s)", value=False, key="auto_refresh")
 
 # Manual refresh
 if st.button("🔄 Refresh Data", key="manual_refresh"):
@@ -5,9 +5,24 @@ import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+import numpy as np
+import orjson
 from typing import Dict, Any, List
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _to_df(payload: bytes) -> pd.DataFrame:
+    """Build a DataFrame from serialized component data, cached on the bytes"""
+    return pd.DataFrame(orjson.loads(payload))
+
+
+def _is_string_column(values: pd.Series) -> bool:
+    """Whether a column can use the .str accessor as is (strings or categories of strings)"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.cat.categories
+    return pd.api.types.infer_dtype(values, skipna=True) == "string"
+
+
 class ComponentLibrary:
     """Library of reusable component templates"""
     
@@ -94,18 +109,51 @@ class ComponentLibrary:
             st.warning("No data available for table")
             return
         
-        df = pd.DataFrame(table_data)
-        
         # Add table controls
         col1, col2, col3 = st.columns(3)
         
         with col1:
             # Search functionality
             search_term = st.text_input(f"Search in {title}", key=f"search_{index}")
-            if search_term:
-                # Filter dataframe based on search term
-                mask = df.astype(str).apply(lambda x: x.str.contains(search_term, case=False, na=False)).any(axis=1)
-                df = df[mask]
+        
+        with col3:
+            # Row limit
+            max_rows = st.number_input(
+                "Max rows",
+                min_value=10,
+                max_value=1000,
+                value=50,
+                step=10,
+                key=f"rows_{index}"
+            )
+        
+        # Only a search has to look at every row; otherwise build the frame
+        # from just the rows that will be shown (row lists only - dict-of-
+        # columns data is built whole and cut down with head())
+        if isinstance(table_data, list) and not search_term:
+            df = pd.DataFrame(table_data[:max_rows])
+        else:
+            df = pd.DataFrame(table_data)
+            if not search_term:
+                df = df.head(max_rows)
+        
+        # Store repetitive string columns as categoricals so Arrow sends each
+        # distinct value once plus integer codes
+        for column in df.select_dtypes(include="object").columns:
+            if (_is_string_column(df[column])
+                    and df[column].nunique() / max(len(df), 1) < 0.5):
+                df[column] = df[column].astype("category")
+        
+        if search_term:
+            # Filter dataframe based on search term: plain substring match,
+            # column by column, stringifying everything but all-string columns
+            mask = np.zeros(len(df), dtype=bool)
+            for column in df.columns:
+                values = df[column]
+                if not _is_string_column(values):
+                    values = values.astype(str)
+                mask |= values.str.contains(search_term, case=False, na=False, regex=False).to_numpy()
+            df = df[mask].head(max_rows)
         
         with col2:
             # Column selection
@@ -119,18 +167,6 @@ class ComponentLibrary:
                 if selected_columns:
                     df = df[selected_columns]
         
-        with col3:
-            # Row limit
-            max_rows = st.number_input(
-                "Max rows",
-                min_value=10,
-                max_value=1000,
-                value=50,
-                step=10,
-                key=f"rows_{index}"
-            )
-            df = df.head(max_rows)
-        
         # Display the table
         st.dataframe(df, use_container_width=True, height=400)
         
@@ -202,7 +238,7 @@ class ComponentLibrary:
             # Trend chart
             trend_data = data.get("trend_data", {})
             if trend_data:
-                df = pd.DataFrame(trend_data)
+                df = _to_df(orjson.dumps(trend_data))
                 if not df.empty:
                     fig = px.line(df, x=df.columns[0], y=df.columns[1], 
                                 title="Trend Analysis")
@@ -214,7 +250,7 @@ class ComponentLibrary:
             # Detailed breakdown
             detail_data = data.get("details", [])
             if detail_data:
-                df = pd.DataFrame(detail_data)
+                df = _to_df(orjson.dumps(detail_data))
                 st.dataframe(df, use_container_width=True)
             else:
                 st.info("No detailed data available")
@@ -222,35 +258,39 @@ class ComponentLibrary:
     @staticmethod
     def get_component_templates() -> Dict[str, Dict[str, Any]]:
         """Get available component templates"""
-        return {
-            "metric_card": {
-                "name": "Metric Card",
-                "description": "Single KPI or metric display",
-                "icon": "📊",
-                "renderer": ComponentLibrary.render_advanced_metric_card
-            },
-            "chart": {
-                "name": "Interactive Chart", 
-                "description": "Bar, line, pie, or scatter charts",
-                "icon": "📈",
-                "renderer": ComponentLibrary.render_interactive_chart
-            },
-            "table": {
-                "name": "Data Table",
-                "description": "Searchable and sortable data table",
-                "icon": "📋",
-                "renderer": ComponentLibrary.render_data_table
-            },
-            "kpi_dashboard": {
-                "name": "KPI Grid",
-                "description": "Multiple metrics in grid layout",
-                "icon": "🎯",
-                "renderer": ComponentLibrary.render_kpi_grid
-            },
-            "financial_summary": {
-                "name": "Financial Summary",
-                "description": "Comprehensive financial overview",
-                "icon": "💰",
-                "renderer": ComponentLibrary.render_financial_summary
-            }
-        }
+        return _COMPONENT_TEMPLATES
+
+
+# Built once at import instead of on every get_component_templates() call
+_COMPONENT_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "metric_card": {
+        "name": "Metric Card",
+        "description": "Single KPI or metric display",
+        "icon": "📊",
+        "renderer": ComponentLibrary.render_advanced_metric_card
+    },
+    "chart": {
+        "name": "Interactive Chart", 
+        "description": "Bar, line, pie, or scatter charts",
+        "icon": "📈",
+        "renderer": ComponentLibrary.render_interactive_chart
+    },
+    "table": {
+        "name": "Data Table",
+        "description": "Searchable and sortable data table",
+        "icon": "📋",
+        "renderer": ComponentLibrary.render_data_table
+    },
+    "kpi_dashboard": {
+        "name": "KPI Grid",
+        "description": "Multiple metrics in grid layout",
+        "icon": "🎯",
+        "renderer": ComponentLibrary.render_kpi_grid
+    },
+    "financial_summary": {
+        "name": "Financial Summary",
+        "description": "Comprehensive financial overview",
+        "icon": "💰",
+        "renderer": ComponentLibrary.render_financial_summary
+    }
+}